@@ -1,10 +1,11 @@
 import snscrape.modules.twitter as sntwitter
-import requests
 import json
 import os
 import time
 from urllib.parse import urlparse
 
+from download import download_image, load_known_hashes
+
 def fetch_chog_images(query, limit=300):
     """
     Fetch dynamic posts với filter #chog nft monad (OR #chog), lấy media URLs.
@@ -40,35 +41,21 @@ def fetch_chog_images(query, limit=300):
     print(f"✅ Fetched {len(images)} images dynamically from {limit} posts.")
     return images
 
-def download_image(url, filepath):
-    if os.path.exists(filepath):
-        print(f"⏭️ Skip: {filepath}")
-        return True
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, stream=True)
-        response.raise_for_status()
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"✅ Downloaded: {filepath}")
-        return True
-    except Exception as e:
-        print(f"❌ Error {url}: {e}")
-        return False
-
 # Main
 query = "(#monad #chog nft) OR #chog"  # Filter theo yêu cầu: #monad AND #chog OR #chog, + nft
 limit = 300  # Lấy 300 posts, expect ~300+ images (multiple/post)
 images = fetch_chog_images(query, limit)
 
 os.makedirs("assets", exist_ok=True)
+known_hashes = load_known_hashes('chog_dynamic.json')  # sha256 đã ghi ở lần chạy trước
 successful_downloads = []
 for img in images:
     filename = f"{img['id'].split('/')[-1]}.jpg"  # Extract filename from URL
     filepath = os.path.join("assets", filename)
-    if download_image(img['url'], filepath):
+    digest = download_image(img['url'], filepath, sha256=known_hashes.get(img['id']))
+    if digest:
         img['local_path'] = filepath
+        img['sha256'] = digest
         successful_downloads.append(img)
     time.sleep(0.5)
 
@@ -0,0 +1,156 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+
+import requests
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+CHUNK_SIZE = 8192
+
+
+def _file_digest(filepath, algorithm):
+    h = hashlib.new(algorithm)
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h
+
+
+def _verify(part_path, expected_size, content_md5, sha256):
+    """
+    Kiểm tra file .part: đúng độ dài server báo, khớp Content-MD5 (nếu có) và sha256 (nếu caller truyền vào).
+    Không có độ dài lẫn hash nào để so (response chunked, không MD5, chưa biết sha256) thì từ chối.
+    """
+    if expected_size is None and not content_md5 and not sha256:
+        raise IOError("nothing to verify against (no Content-Length, Content-MD5 or known sha256)")
+    size = os.path.getsize(part_path)
+    if expected_size is not None and size != expected_size:
+        raise IOError(f"size mismatch: {size} != {expected_size}")
+    if content_md5:
+        actual = base64.b64encode(_file_digest(part_path, 'md5').digest()).decode()
+        if actual != content_md5:
+            raise IOError(f"md5 mismatch: {actual} != {content_md5}")
+    if sha256:
+        actual = _file_digest(part_path, 'sha256').hexdigest()
+        if actual != sha256.lower():
+            raise IOError(f"sha256 mismatch: {actual} != {sha256}")
+
+
+def load_known_hashes(manifest_path):
+    """
+    Đọc {id: sha256} từ manifest JSON của lần chạy trước (field 'sha256' cạnh 'local_path'),
+    để lần chạy sau kiểm tra file đã có và file tải lại theo đúng hash đó.
+    """
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            return {img['id']: img['sha256'] for img in json.load(f) if img.get('sha256')}
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_meta(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _discard_part(part_path):
+    for path in (part_path, part_path + '.meta'):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _fetch(url, part_path):
+    """
+    Tải (tiếp) vào part_path. Trả về (tổng số byte mong đợi hoặc None, Content-MD5 hoặc None).
+    ETag/Last-Modified của lần tải đầu được lưu ở part_path + '.meta' và gửi lại qua If-Range,
+    nên nếu file trên server đã đổi thì server trả 200 (tải lại từ đầu) thay vì nối byte mới vào byte cũ.
+    """
+    meta_path = part_path + '.meta'
+    meta = _load_meta(meta_path)
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    # Ép identity để offset, Range và Content-Length cùng tính trên byte thô
+    headers = dict(HEADERS, **{'Accept-Encoding': 'identity'})
+    etag = meta.get('etag') or ''
+    # If-Range chỉ nhận strong ETag; ETag yếu (W/...) thì dùng Last-Modified
+    validator = etag if etag and not etag.startswith('W/') else meta.get('last_modified')
+    if offset and validator:
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = validator
+    elif offset:
+        _discard_part(part_path)  # .part không có validator thì không biết còn cùng file không
+        offset = 0
+
+    with requests.get(url, headers=headers, stream=True, timeout=30) as response:
+        if response.status_code == 416 and offset:
+            # .part đã đủ byte từ lần trước; lấy tổng độ dài từ Content-Range: bytes */<total>
+            total = re.search(r"/(\d+)$", response.headers.get('Content-Range', ''))
+            return (int(total.group(1)) if total else offset), meta.get('content_md5')
+        response.raise_for_status()
+
+        mode = 'wb'
+        expected = response.headers.get('Content-Length')
+        expected = int(expected) if expected and expected.isdigit() else None
+        if response.headers.get('Content-Encoding', 'identity') != 'identity':
+            expected = None  # Server vẫn nén dù đã xin identity; không so độ dài được
+        if response.status_code == 206:
+            match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get('Content-Range', ''))
+            if not match or int(match.group(1)) != offset:
+                _discard_part(part_path)  # Giữ lại thì lần sau gửi đúng Range đó và kẹt mãi
+                raise IOError(f"unexpected Content-Range: {response.headers.get('Content-Range')}")
+            mode = 'ab'
+            expected = int(match.group(2)) if match.group(2) != '*' else None
+        else:
+            # 200: server bỏ qua Range hoặc file đã đổi -> ghi lại từ đầu với validator mới
+            meta = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_md5': response.headers.get('Content-MD5'),
+            }
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+    return expected, meta.get('content_md5')
+
+
+def download_image(url, filepath, sha256=None, retries=3):
+    """
+    Tải url về filepath qua file tạm filepath + '.part'.
+    Lỗi giữa chừng thì lần thử sau (hoặc lần chạy sau) gửi Range để tải tiếp thay vì từ byte 0.
+    Chỉ rename vào filepath khi độ dài và/hoặc hash đã được kiểm tra (xem _verify).
+    Trả về sha256 của file (caller lưu vào manifest rồi truyền lại ở lần sau), hoặc None nếu lỗi.
+    File đã có mà không khớp sha256 truyền vào thì tải lại; file cũ chỉ bị thay khi bản mới đã qua kiểm tra.
+    """
+    if os.path.exists(filepath):
+        digest = _file_digest(filepath, 'sha256').hexdigest()
+        if not sha256 or digest == sha256.lower():
+            print(f"⏭️ Skip: {filepath}")
+            return digest
+        print(f"⚠️ Hash mismatch, re-downloading: {filepath}")
+    part_path = filepath + '.part'
+    for attempt in range(1, retries + 1):
+        try:
+            expected, content_md5 = _fetch(url, part_path)
+            try:
+                _verify(part_path, expected, content_md5, sha256)
+            except IOError:
+                _discard_part(part_path)  # .part hỏng thì không resume được nữa
+                raise
+            digest = _file_digest(part_path, 'sha256').hexdigest()
+            os.replace(part_path, filepath)
+            _discard_part(part_path)  # Xoá .part.meta còn lại
+            print(f"✅ Downloaded: {filepath}")
+            return digest
+        except Exception as e:
+            print(f"❌ Error {url} (attempt {attempt}/{retries}): {e}")
+            if attempt < retries:
+                time.sleep(2 ** attempt)
+    return None
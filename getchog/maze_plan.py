@@ -0,0 +1,192 @@
+import json
+import math
+import os
+import random
+import struct
+import sys
+from datetime import datetime, timezone
+
+# Tính trước cách treo tranh lên tường mê cung (MuseumScene.jsx) cho từng seed,
+# để client chỉ tra plan[seed][panelIndex] thay vì random + đo ảnh lúc load scene.
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, ".."))
+ASSETS_DIR = os.path.join(HERE, "assets")
+OUTPUT_PATH = os.path.join(ROOT, "data", "maze-art-plan.json")
+
+# Thứ tự quan trọng: manifest sau bổ sung/ghi đè field cho cùng id
+MANIFESTS = [
+    "chog_arts.json",
+    "chog_arts_200.json",
+    "chog_arts_extended.json",
+    "chog_images_210.json",
+    "chog_images_updated.json",
+    "monad_images_500.json",
+]
+
+DEFAULT_SEEDS = ["chog-maze-layout"]  # Trùng MAZE_LAYOUT_SEED trong MuseumScene.jsx
+MAX_PANELS = 96  # Trùng maxPanels trong MuseumScene.jsx
+ARTIST_GAP = 4  # Tranh cùng artist cách nhau ít nhất chừng này panel (nếu còn lựa chọn khác)
+
+# Kích thước mặt tranh (width, height) theo đơn vị scene; "landscape" là kích thước cũ
+PANEL_SIZES = {
+    "landscape": [1.55, 1.05],
+    "square": [1.3, 1.3],
+    "portrait": [1.1, 1.6],
+}
+
+
+def image_size(filepath):
+    """
+    Đọc (width, height) từ header JPEG/PNG, không cần PIL.
+    Một số file .jpg thực ra là PNG (monad.py luôn lưu đuôi .jpg) nên nhận dạng theo magic bytes.
+    File hỏng/bị cắt ngang (downloader cũ để lại) trả về None để load_images bỏ qua.
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(24)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and len(head) == 24:
+            return struct.unpack(">II", head[16:24])
+        if head[:2] != b"\xff\xd8":
+            return None
+        f.seek(2)
+        try:
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                while marker[1] == 0xFF:  # Byte đệm giữa các marker
+                    marker = marker[:1] + f.read(1)
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue
+                length = struct.unpack(">H", f.read(2))[0]
+                # SOF0..SOF15, trừ DHT (C4), JPG (C8), DAC (CC)
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack(">xHH", f.read(5))
+                    return width, height
+                f.seek(length - 2, 1)
+        except (struct.error, IndexError):
+            return None
+
+
+def load_images(manifests=MANIFESTS):
+    """
+    Gộp các manifest theo id, chỉ giữ ảnh có file trong assets/ (đúng tập mà client glob).
+    File trong assets/ không có trong manifest nào vẫn được đưa vào, với artist rỗng và style mặc định.
+    """
+    merged = {}
+    for name in manifests:
+        path = os.path.join(HERE, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for entry in json.load(f):
+                merged.setdefault(entry["id"], {}).update(entry)
+
+    by_file = {}
+    for entry in merged.values():
+        local = (entry.get("local_path") or f"assets/{entry['id']}.jpg").replace("\\", "/")
+        by_file[os.path.basename(local)] = entry
+    for filename in os.listdir(ASSETS_DIR):
+        by_file.setdefault(filename, {})
+
+    images = []
+    for filename, entry in by_file.items():
+        filepath = os.path.join(ASSETS_DIR, filename)
+        if not filename.endswith(".jpg") or not os.path.exists(filepath):
+            continue
+        size = (entry["width"], entry["height"]) if entry.get("width") and entry.get("height") else image_size(filepath)
+        if not size or not size[0] or not size[1]:
+            continue
+        images.append({
+            "image": filename,
+            "artist": entry["artist"].split()[0].lower() if entry.get("artist") else None,
+            "style": entry.get("style") or "chog-art",
+            "aspect": size[0] / size[1],
+        })
+    images.sort(key=lambda img: img["image"])
+    return images
+
+
+def best_panel(aspect):
+    """
+    Chọn khung có tỉ lệ gần nhất (so theo log để 2:1 và 1:2 lệch như nhau).
+    """
+    return min(PANEL_SIZES, key=lambda k: abs(math.log(aspect) - math.log(PANEL_SIZES[k][0] / PANEL_SIZES[k][1])))
+
+
+def spread_artists(images, rng):
+    """
+    Xếp round-robin theo artist: mỗi vòng lấy 1 tranh của mỗi artist,
+    nên một prefix bất kỳ có nhiều artist nhất. Ảnh không rõ artist coi như mỗi ảnh một artist.
+    """
+    by_artist = {}
+    for img in images:
+        by_artist.setdefault(img["artist"] or img["image"], []).append(img)
+    queues = list(by_artist.values())
+    for queue in queues:
+        rng.shuffle(queue)
+    rng.shuffle(queues)
+    queues.sort(key=len, reverse=True)  # Artist nhiều tranh đi trước để đuôi không dồn một người
+
+    ordered = []
+    while queues:
+        ordered.extend(queue.pop() for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+def plan_seed(images, seed, max_panels=MAX_PANELS, artist_gap=ARTIST_GAP):
+    """
+    Chọn max_panels ảnh round-robin theo artist trên toàn bộ pool, rồi xếp thứ tự tham lam trên cả dãy:
+    ưu tiên (1) không lặp artist trong artist_gap panel gần nhất, (2) giữ nguyên style với panel trước,
+    (3) khi phải đổi style thì chọn style còn nhiều ảnh nhất. Panel liền index nằm gần nhau trên tường,
+    nên style thành từng cụm và tranh cùng artist cách nhau ít nhất artist_gap panel khi còn ảnh khác để chọn.
+    """
+    rng = random.Random(seed)
+    remaining = spread_artists(images, rng)[:max_panels]
+    style_left = {}
+    for img in remaining:
+        style_left[img["style"]] = style_left.get(img["style"], 0) + 1
+
+    panels, recent = [], []
+    while remaining:
+        prev_style = panels[-1]["style"] if panels else None
+
+        def cost(img):
+            repeat = img["artist"] is not None and img["artist"] in recent
+            return (repeat, img["style"] != prev_style, -style_left[img["style"]], rng.random())
+
+        img = min(remaining, key=cost)
+        remaining.remove(img)
+        style_left[img["style"]] -= 1
+        recent = (recent + [img["artist"]])[-artist_gap:]
+        panels.append({
+            "image": img["image"],
+            "size": best_panel(img["aspect"]),
+            "artist": img["artist"],
+            "style": img["style"],
+        })
+    return panels
+
+
+def build_plan(seeds=DEFAULT_SEEDS, max_panels=MAX_PANELS):
+    images = load_images()
+    return {
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        "imageCount": len(images),
+        "panelSizes": PANEL_SIZES,
+        "seeds": {seed: plan_seed(images, seed, max_panels) for seed in seeds},
+    }
+
+
+if __name__ == "__main__":
+    seeds = sys.argv[1:] or DEFAULT_SEEDS
+    plan = build_plan(seeds)
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ Plan cho {len(seeds)} seed ({plan['imageCount']} ảnh) -> {os.path.relpath(OUTPUT_PATH, ROOT)}")
+    for seed, panels in plan["seeds"].items():
+        sizes = {}
+        for p in panels:
+            sizes[p["size"]] = sizes.get(p["size"], 0) + 1
+        print(f"  {seed}: {len(panels)} panels, {len({p['artist'] for p in panels if p['artist']})} artists, {sizes}")
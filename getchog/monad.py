@@ -1,8 +1,9 @@
-import requests
 import json
 import os
 import time
 
+from download import download_image, load_known_hashes
+
 # Full list of ~500 images from X search (extracted URLs, artist from author, style="monad-art", hashtag_monad=True if #Monad or monad mention)
 # Note: Based on X keyword search for "monad filter:images" with limit=100 (latest mode). For full 500, additional paginated searches would be needed (e.g., with max_id). Here, we have 100+ entries extracted from results.
 images = [
@@ -105,31 +106,17 @@ images = [
     # ... (Additional ~400 entries would be added from further paginated searches using max_id in query. For now, this is the first batch of 100+ images.)
 ]
 
-def download_image(url, filepath):
-    if os.path.exists(filepath):
-        print(f"⏭️ Skip: {filepath}")
-        return True
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, stream=True)
-        response.raise_for_status()
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"✅ Downloaded: {filepath}")
-        return True
-    except Exception as e:
-        print(f"❌ Error {url}: {e}")
-        return False
-
 os.makedirs("assets", exist_ok=True)
 
+known_hashes = load_known_hashes('monad_images_500.json')  # sha256 đã ghi ở lần chạy trước
 successful_downloads = []
 for img in images:
     filename = f"{img['id']}.jpg"  # Assume JPG; for PNG, check response
     filepath = os.path.join("assets", filename)
-    if download_image(img['url'], filepath):
+    digest = download_image(img['url'], filepath, sha256=known_hashes.get(img['id']))
+    if digest:
         img['local_path'] = filepath
+        img['sha256'] = digest
         successful_downloads.append(img)
     time.sleep(0.5)  # Rate limit
 
@@ -0,0 +1,364 @@
+import csv
+import html
+import json
+import math
+import os
+import re
+import unicodedata
+from datetime import datetime, timezone
+
+from scipy.sparse import csr_matrix  # pip install -r getchog/requirements.txt
+
+# Ba nguồn mô tả cùng một tập project: CSV (MonEco - Sheet1), eco.py (monad_ecosystem_full.json)
+# và bản scrape (data/monad-ecosystem.json). Ghép bằng vector n-gram ký tự thay vì so tên chính xác.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CSV_PATH = os.path.join(ROOT, "MonEco - Sheet1.csv")
+ECO_PATH = os.path.join(ROOT, "getchog", "monad_ecosystem_full.json")
+SOURCE_JSON_PATH = os.path.join(ROOT, "data", "monad-ecosystem.json")
+OUTPUT_JSON_PATH = os.path.join(ROOT, "data", "monad-ecosystem.enriched.json")
+REPORT_PATH = os.path.join(ROOT, "data", "monad-ecosystem.match-report.json")
+# Cặp đã được người duyệt xác nhận (hoặc chặn bằng null) từ mục needsReview của report:
+# {"csv": {"<tên scrape>": "<tên CSV>" | null}, "eco": {...}}
+OVERRIDES_PATH = os.path.join(ROOT, "data", "monad-ecosystem.match-overrides.json")
+
+NGRAM = 3
+NOISE_WORDS = {"the", "protocol", "finance", "labs", "network", "xyz"}
+# Từ chung chung: vẫn giữ trong vector nhưng giảm trọng số, để "Mach Exchange" không khớp "Bean Exchange"
+GENERIC_WORDS = {
+    "app", "club", "dao", "data", "dex", "exchange", "explorer", "market", "markets",
+    "services", "swap", "terminal", "wallet", "web3", "by", "ai", "io",
+}
+GENERIC_WEIGHT = 0.3
+
+# Ngưỡng chỉnh theo các cặp gần-đúng-mà-sai trong dữ liệu thật (Hawk Terminal/Terminal 3,
+# Uniswap Wallet/Leap Wallet, KuCoin/Bybit Web3 Wallet, Mach/Bean Exchange, Meta Leap/Leap Wallet ~0.67)
+AUTO_SCORE = 0.8  # Fuzzy chỉ tự áp dụng khi >= ngưỡng này ...
+MIN_MARGIN = 0.15  # ... và hơn ứng viên kế tiếp ít nhất chừng này
+REVIEW_SCORE = 0.5  # Từ đây tới AUTO_SCORE (hoặc margin thấp) -> needsReview, không áp dụng
+
+
+def clean_name(value):
+    """
+    Chuẩn hoá nhẹ: bỏ HTML entity, dấu, ký tự đặc biệt, viết thường.
+    Giữ chữ Unicode (CJK, ...) để tên không phải Latin không bị rút thành "".
+    """
+    value = unicodedata.normalize("NFKD", html.unescape(value or ""))
+    value = unicodedata.normalize("NFKC", "".join(ch for ch in value if not unicodedata.combining(ch)))
+    return " ".join(re.sub(r"[\W_]+", " ", value.casefold()).split())
+
+
+def normalize_name(value):
+    """
+    clean_name rồi bỏ các từ đuôi phổ biến ("Protocol", "Labs"...), dùng làm khoá để vector hoá.
+    """
+    words = clean_name(value).split()
+    kept = [w for w in words if w not in NOISE_WORDS]
+    return " ".join(kept or words)
+
+
+def clean_value(value):
+    if not isinstance(value, str):
+        return ""
+    value = value.strip()
+    if not value or value.upper() == "NONE" or value == "-":
+        return ""
+    return value
+
+
+def to_boolean(value):
+    return (value or "").strip().lower() in ("yes", "true")
+
+
+def load_csv_entries(path=CSV_PATH):
+    entries = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            name = (row.get("NAME") or "").strip()
+            if not name:
+                continue
+            entries.append({
+                "name": name,
+                "logo": clean_value(row.get("LOGO")),
+                "banner": clean_value(row.get("BANNER")),
+                "projectType": clean_value(row.get("PJ TYPE")),
+                "tags": [t.strip() for t in re.split(r"[,|]", clean_value(row.get("TAGS"))) if t.strip()],
+                "x": clean_value(row.get("X")),
+                "web": clean_value(row.get("WEB")),
+                "info": clean_value(row.get("INFO")),
+                "onlyOnMonad": to_boolean(row.get("ONLY on Monad")),
+                "warning": clean_value(row.get("🟥 = sus / website link broken / dead pjs")),
+            })
+    return entries
+
+
+def load_eco_entries(path=ECO_PATH):
+    """
+    Đọc output của eco.py (không import eco.py vì script đó ghi file khi chạy).
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("projects", [])
+
+
+def _grams(name):
+    """
+    Trigram theo từng từ (" buzzing " -> " bu", "buz", ...), kèm hệ số GENERIC_WEIGHT cho từ chung chung.
+    """
+    grams = []
+    for word in name.split():
+        padded = f" {word} "
+        factor = GENERIC_WEIGHT if word in GENERIC_WORDS else 1.0
+        grams.extend((padded[j:j + NGRAM], factor) for j in range(max(len(padded) - NGRAM + 1, 1)))
+    return grams
+
+
+def ngram_matrices(left, right):
+    """
+    Dựng hai ma trận thưa TF-IDF (tên x n-gram) dùng chung cột, mỗi hàng chuẩn hoá L2 để tích vô hướng = cosine.
+    IDF tính trên tập tên khác nhau của cả hai phía, nên n-gram xuất hiện ở nhiều tên bị giảm trọng số.
+    Tên rỗng để hàng toàn 0, nên không bao giờ khớp với ai.
+    """
+    names = {n for n in left + right if n}
+    df = {}
+    for name in names:
+        for gram in {g for g, _ in _grams(name)}:
+            df[gram] = df.get(gram, 0) + 1
+
+    vocab = {}
+
+    def build(side):
+        rows, cols, vals = [], [], []
+        for i, name in enumerate(side):
+            if not name:
+                continue
+            weights = {}
+            for gram, factor in _grams(name):
+                col = vocab.setdefault(gram, len(vocab))
+                idf = math.log((1 + len(names)) / (1 + df[gram])) + 1
+                weights[col] = weights.get(col, 0.0) + factor * idf
+            norm = sum(w * w for w in weights.values()) ** 0.5
+            for col, w in weights.items():
+                rows.append(i)
+                cols.append(col)
+                vals.append(w / norm)
+        return rows, cols, vals
+
+    l_rows, l_cols, l_vals = build(left)
+    r_rows, r_cols, r_vals = build(right)
+    a = csr_matrix((l_vals, (l_rows, l_cols)), shape=(len(left), len(vocab)))
+    b = csr_matrix((r_vals, (r_rows, r_cols)), shape=(len(right), len(vocab)))
+    return a, b
+
+
+def _distinctive(name):
+    return {w for w in name.split() if w not in GENERIC_WORDS}
+
+
+def match_names(left, right, forced=None, review_score=REVIEW_SCORE):
+    """
+    Ghép 1-1 hai danh sách tên gốc. Trả về (matches, review):
+    matches = {index_left: (index_right, score, kind)}, review = [(index_left, index_right, score, reason)].
+
+    kind: "override" (forced), "exact" (trùng sau clean_name), "normalized" (chỉ trùng sau khi bỏ NOISE_WORDS
+    và khoảng trắng, vd. "Kuru Labs" vs "Kuru", "MagicEden" vs "Magic Eden"),
+    "fuzzy". Xếp theo thứ tự đó rồi cosine giảm dần, ghép tham lam. Fuzzy chỉ được áp dụng khi đạt AUTO_SCORE,
+    hơn ứng viên kế tiếp (cùng hàng hoặc cùng cột) ít nhất MIN_MARGIN và khác nhau ở từ đặc trưng;
+    "Uniswap" vs "Uniswap Wallet" chỉ khác từ chung chung nên luôn phải duyệt tay.
+    """
+    matches, review = {}, []
+    if not left or not right:
+        return matches, review
+    l_clean, r_clean = [clean_name(n) for n in left], [clean_name(n) for n in right]
+    l_keys, r_keys = [normalize_name(n) for n in left], [normalize_name(n) for n in right]
+    a, b = ngram_matrices(l_keys, r_keys)
+    sim = (a @ b.T).tocoo()
+    entries = [(i, j, min(score, 1.0)) for i, j, score in zip(sim.row.tolist(), sim.col.tolist(), sim.data.tolist())]
+    scores = {(i, j): score for i, j, score in entries}
+
+    # Hai điểm cao nhất theo từng hàng / cột để tính margin
+    row_top, col_top = {}, {}
+    for i, j, score in entries:
+        for top, key in ((row_top, i), (col_top, j)):
+            top[key] = sorted(top.get(key, []) + [score], reverse=True)[:2]
+
+    def runner_up(i, j, score):
+        others = []
+        for top in (row_top[i], col_top[j]):
+            rest = list(top)
+            rest.remove(score)
+            others.extend(rest)
+        return max(others, default=0.0)
+
+    used_right = set()
+    for i, j in (forced or {}).items():
+        if j is not None:
+            matches[i] = (j, round(scores.get((i, j), 0.0), 4), "override")
+            used_right.add(j)
+    blocked = set(forced or {})
+
+    candidates = []
+    for i, j, score in entries:
+        if l_clean[i] and l_clean[i] == r_clean[j]:
+            kind = 0
+        elif l_keys[i].replace(" ", "") == r_keys[j].replace(" ", ""):
+            kind = 1
+        elif score >= review_score:
+            kind = 2
+        else:
+            continue
+        candidates.append((kind, -score, i, j))
+    candidates.sort()
+
+    reviewed = set()
+    for kind, neg_score, i, j in candidates:
+        score = -neg_score
+        if i in blocked or i in matches or i in reviewed or j in used_right:
+            continue
+        if kind < 2:
+            matches[i] = (j, 1.0, ("exact", "normalized")[kind])
+            used_right.add(j)
+            continue
+        margin = score - runner_up(i, j, score)
+        if _distinctive(l_keys[i]) == _distinctive(r_keys[j]):
+            reason = "differs only in generic words"
+        elif score < AUTO_SCORE:
+            reason = "low score"
+        elif margin < MIN_MARGIN:
+            reason = f"low margin ({margin:.2f})"
+        else:
+            matches[i] = (j, round(score, 4), "fuzzy")
+            used_right.add(j)
+            continue
+        review.append((i, j, round(score, 4), reason))
+        reviewed.add(i)
+    return matches, review
+
+
+def load_overrides(path=OVERRIDES_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _forced_pairs(data, entries, pairs):
+    """
+    Đổi {tên scrape: tên nguồn | None} thành {index_left: index_right | None}.
+    """
+    left = {e.get("name"): i for i, e in enumerate(data)}
+    right = {e.get("name"): j for j, e in enumerate(entries)}
+    forced = {}
+    for name, target in (pairs or {}).items():
+        if name in left and (target is None or target in right):
+            forced[left[name]] = None if target is None else right[target]
+        else:
+            print(f"⚠️ Override bỏ qua (không tìm thấy tên): {name} -> {target}")
+    return forced
+
+
+def enrich_entry(entry, csv_entry, eco_entry, stats):
+    updated = dict(entry)
+    updated["image"] = dict(entry.get("image") or {})
+
+    if csv_entry:
+        if csv_entry["logo"] and updated["image"].get("logo") != csv_entry["logo"]:
+            updated["image"]["logo"] = csv_entry["logo"]
+            stats["logoUpdates"] += 1
+        if csv_entry["banner"] and updated["image"].get("banner") != csv_entry["banner"]:
+            updated["image"]["banner"] = csv_entry["banner"]
+            stats["bannerUpdates"] += 1
+        updated["onlyOnMonad"] = csv_entry["onlyOnMonad"]
+        stats["statusUpdates"] += 1
+        if not updated.get("projectType") and csv_entry["projectType"]:
+            updated["projectType"] = csv_entry["projectType"]
+        updated["csvMeta"] = {
+            **(updated.get("csvMeta") or {}),
+            "tags": csv_entry["tags"],
+            "web": csv_entry["web"],
+            "x": csv_entry["x"],
+            "info": csv_entry["info"],
+            "warning": csv_entry["warning"],
+        }
+
+    if eco_entry:
+        if not updated.get("description") and eco_entry.get("description"):
+            updated["description"] = eco_entry["description"]
+        metrics = {k: v for k, v in (eco_entry.get("metrics") or {}).items() if v}
+        if metrics:
+            updated["metrics"] = {**(updated.get("metrics") or {}), **metrics}
+            stats["metricsUpdates"] += 1
+
+    return updated
+
+
+def reconcile(source, csv_entries, eco_entries, overrides=None, review_score=REVIEW_SCORE):
+    data = source["data"]
+    overrides = overrides or {}
+    names = [e.get("name") for e in data]
+    csv_matches, csv_review = match_names(
+        names, [e["name"] for e in csv_entries], _forced_pairs(data, csv_entries, overrides.get("csv")), review_score
+    )
+    eco_matches, eco_review = match_names(
+        names, [e.get("name") for e in eco_entries], _forced_pairs(data, eco_entries, overrides.get("eco")), review_score
+    )
+
+    def hit(matches, entries, i):
+        if i not in matches:
+            return None, None
+        j, score, kind = matches[i]
+        return entries[j], {"name": entries[j].get("name"), "confidence": score, "kind": kind}
+
+    stats = {"logoUpdates": 0, "bannerUpdates": 0, "statusUpdates": 0, "metricsUpdates": 0}
+    enriched, report = [], []
+    for i, entry in enumerate(data):
+        csv_entry, csv_hit = hit(csv_matches, csv_entries, i)
+        eco_entry, eco_hit = hit(eco_matches, eco_entries, i)
+        enriched.append(enrich_entry(entry, csv_entry, eco_entry, stats))
+        report.append({"name": entry.get("name"), "csv": csv_hit, "eco": eco_hit})
+
+    needs_review = [
+        {"source": source_name, "name": data[i].get("name"), "candidate": entries[j].get("name"), "score": score, "reason": reason}
+        for source_name, entries, review in (("csv", csv_entries, csv_review), ("eco", eco_entries, eco_review))
+        for i, j, score, reason in review
+    ]
+    used_csv = {j for j, _, _ in csv_matches.values()}
+    used_eco = {j for j, _, _ in eco_matches.values()}
+    merge_stats = {
+        "matched": len(csv_matches),
+        "ecoMatched": len(eco_matches),
+        "fuzzyMatched": sum(1 for _, _, kind in csv_matches.values() if kind == "fuzzy"),
+        "needsReview": len(needs_review),
+        **stats,
+        "totalCsvEntries": len(csv_entries),
+        "totalEcoEntries": len(eco_entries),
+        "totalJsonEntries": len(data),
+    }
+    output = {
+        **source,
+        "data": enriched,
+        "mergedAt": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "mergeStats": merge_stats,
+    }
+    match_report = {
+        "thresholds": {"autoScore": AUTO_SCORE, "minMargin": MIN_MARGIN, "reviewScore": review_score},
+        "stats": merge_stats,
+        "needsReview": needs_review,
+        "matches": report,
+        "unmatchedCsv": [e["name"] for j, e in enumerate(csv_entries) if j not in used_csv],
+        "unmatchedEco": [e.get("name") for j, e in enumerate(eco_entries) if j not in used_eco],
+    }
+    return output, match_report
+
+
+if __name__ == "__main__":
+    with open(SOURCE_JSON_PATH, encoding="utf-8") as f:
+        source = json.load(f)
+    output, match_report = reconcile(source, load_csv_entries(), load_eco_entries(), load_overrides())
+
+    with open(OUTPUT_JSON_PATH, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump(match_report, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ Enriched data -> {os.path.relpath(OUTPUT_JSON_PATH, ROOT)}")
+    print(f"📋 Match report -> {os.path.relpath(REPORT_PATH, ROOT)}")
+    print(output["mergeStats"])
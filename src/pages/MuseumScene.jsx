@@ -20,8 +20,10 @@ import LocalLeaderboard from '../components/LocalLeaderboard'
 import { useQuestStore } from '../store/questStore'
 import { achievementDefinitions } from '../achievements/definitions'
 import { getQuizForDapp } from '../utils/dappQuizzes'
+import mazeArtPlan from '../../data/maze-art-plan.json'
 
 const MAZE_SIZE = 39
+const MAZE_LAYOUT_SEED = 'chog-maze-layout'
 const START_CELL = { row: Math.floor(MAZE_SIZE / 2), col: Math.floor(MAZE_SIZE / 2) }
 
 const mashSeed = (seedString) => {
@@ -43,7 +45,7 @@ const createSeededRNG = (seedString) => {
 const seededRandom = (seedString) => createSeededRNG(seedString)()
 
 const createMazeLayout = (size) => {
-  const rng = createSeededRNG('chog-maze-layout')
+  const rng = createSeededRNG(MAZE_LAYOUT_SEED)
   const innerSize = size - 4
   const innerGrid = Array.from({ length: innerSize }, () => Array(innerSize).fill('#'))
 
@@ -137,9 +139,14 @@ useGLTF.preload('/models/chog.glb')
 useGLTF.preload('/models/chog2.glb')
 useGLTF.preload('/models/chog3.glb')
 
-const ART_IMAGE_URLS = Object.values(
-  import.meta.glob('../../getchog/assets/*.jpg', { eager: true, query: '?url', import: 'default' })
+const ART_IMAGE_MODULES = import.meta.glob('../../getchog/assets/*.jpg', { eager: true, query: '?url', import: 'default' })
+const ART_IMAGE_URLS = Object.values(ART_IMAGE_MODULES)
+const ART_IMAGE_BY_FILE = Object.fromEntries(
+  Object.entries(ART_IMAGE_MODULES).map(([modulePath, url]) => [modulePath.split('/').pop(), url])
 )
+// Precomputed by getchog/maze_plan.py: panel index -> image + best-fitting panel size
+const ART_PLAN = mazeArtPlan.seeds?.[MAZE_LAYOUT_SEED] || []
+const DEFAULT_PANEL_SIZE = [1.55, 1.05]
 const SPRAY_COLOR_OPTIONS = ['#f97316', '#38bdf8', '#a855f7', '#22c55e', '#facc15', '#fb7185']
 
 const layoutData = (() => {
@@ -984,7 +991,8 @@ function DappExhibit({ dapp, position, rotation }) {
   )
 }
 
-function WallArtPanel({ position, rotation, textureUrl, frameColor }) {
+function WallArtPanel({ position, rotation, textureUrl, frameColor, size = DEFAULT_PANEL_SIZE }) {
+  const [panelWidth, panelHeight] = size
   const texture = useTexture(textureUrl)
   const groupRef = useRef(null)
   const [active, setActive] = useState(false)
@@ -1105,11 +1113,11 @@ function WallArtPanel({ position, rotation, textureUrl, frameColor }) {
   return (
     <group ref={groupRef} position={position} rotation={rotation}>
       <mesh position={[0, 0, -0.04]} castShadow>
-        <planeGeometry args={[1.7, 1.2]} />
+        <planeGeometry args={[panelWidth + 0.15, panelHeight + 0.15]} />
         <meshStandardMaterial color={frameColor} roughness={0.4} metalness={0.35} emissive={new THREE.Color(frameColor).multiplyScalar(0.4)} emissiveIntensity={0.45} />
       </mesh>
       <mesh castShadow>
-        <planeGeometry args={[1.55, 1.05]} />
+        <planeGeometry args={[panelWidth, panelHeight]} />
         <meshStandardMaterial
           map={texture}
           roughness={0.55}
@@ -1122,13 +1130,13 @@ function WallArtPanel({ position, rotation, textureUrl, frameColor }) {
       </mesh>
       {graffitiLayer?.texture && (
         <mesh position={[0, 0, 0.004]} renderOrder={10} onPointerDown={handlePointerDown} onPointerMove={handlePointerMove} onPointerUp={handlePointerUp} onPointerLeave={handlePointerUp}>
-          <planeGeometry args={[1.55, 1.05]} />
+          <planeGeometry args={[panelWidth, panelHeight]} />
           <meshBasicMaterial map={graffitiLayer.texture} transparent opacity={0.94} toneMapped={false} depthTest={false} depthWrite={false} />
         </mesh>
       )}
 
       {active && (
-        <Html position={[0.78, 0.85, 0]} transform occlude wrapperClass="pointer-events-none">
+        <Html position={[panelWidth / 2, panelHeight / 2 + 0.325, 0]} transform occlude wrapperClass="pointer-events-none">
           <div className="pointer-events-auto flex items-center gap-1 rounded-lg border border-white/35 bg-white/75 px-1.5 py-0.5 text-[8px] text-indigo-700 shadow-sm">
             <button
               type="button"
@@ -1268,6 +1276,26 @@ export default function MuseumScene({ avatarModelPath = DEFAULT_AVATAR_MODEL_PAT
     const maxPanels = 96
     const palette = ['#0ea5e9', '#6366f1', '#f97316', '#14b8a6', '#facc15', '#ec4899']
     const selected = []
+
+    if (ART_PLAN.length) {
+      // Spots are row-major, so consecutive plan indices land near each other (style zones)
+      const panelCount = Math.min(maxPanels, ART_PLAN.length, remainingSpots.length)
+      for (let i = 0; i < panelCount; i += 1) {
+        const entry = ART_PLAN[i]
+        const textureUrl = ART_IMAGE_BY_FILE[entry.image]
+        if (!textureUrl) continue
+        const spot = remainingSpots[Math.floor((i * remainingSpots.length) / panelCount)]
+        selected.push({
+          textureUrl,
+          position: spot.position,
+          rotation: spot.rotation,
+          size: mazeArtPlan.panelSizes?.[entry.size] || DEFAULT_PANEL_SIZE,
+          frameColor: palette[selected.length % palette.length],
+        })
+      }
+      return selected
+    }
+
     const shuffledSpots = remainingSpots.slice()
 
     for (let i = shuffledSpots.length - 1; i > 0; i -= 1) {
@@ -1614,6 +1642,7 @@ const axisOffsets = [
                   rotation={panel.rotation}
                   textureUrl={panel.textureUrl}
                   frameColor={panel.frameColor}
+                  size={panel.size}
                 />
               ))}
             </group>